@@ -6,22 +6,317 @@ Data structures for GitHub automation features.
 Stored in .auto-claude/github/pr/ and .auto-claude/github/issues/
 
 All save() operations use file locking to prevent corruption in concurrent scenarios.
+
+Performance note: this module is deliberately kept as interpreter-friendly
+pure Python rather than AOT-compiled (mypyc/Cython). The backend ships as
+source inside the packaged app with no extension-build step, and the hot
+serialization paths already run in native code via the optional orjson and
+msgspec dependencies; the __init__-bypassing from_dict constructors are also
+incompatible with mypyc native classes.
 """
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field
-from datetime import datetime
+import asyncio
+import atexit
+import os
+import time
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 
 try:
-    from .file_lock import locked_json_update, locked_json_write
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+try:
+    from .file_lock import (
+        FileLock,
+        dumps_json_bytes,
+        loads_json_bytes,
+        locked_write,
+    )
 except (ImportError, ValueError, SystemError):
-    from file_lock import locked_json_update, locked_json_write
+    from file_lock import (
+        FileLock,
+        dumps_json_bytes,
+        loads_json_bytes,
+        locked_write,
+    )
+
+
+def _to_json_bytes(obj) -> bytes:
+    """Serialize a model dataclass straight to indented JSON bytes.
+
+    orjson walks dataclass fields natively in C, so this skips the
+    intermediate to_dict() tree (and its nested list of finding dicts)
+    that the encoder would otherwise have to traverse a second time.
+    Falls back to the to_dict() path without orjson.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return dumps_json_bytes(obj.to_dict())
+
+
+def _load_json(path: Path) -> dict:
+    """Read and parse a JSON file (orjson-backed when available)."""
+    return loads_json_bytes(path.read_bytes())
+
+
+def _dump_json(path: Path, obj: dict, indent: int = 2) -> None:
+    """Atomically write obj as JSON: one contiguous write, then a rename.
+
+    Serializing to bytes first means the temp file gets a single write
+    syscall; os.replace makes the swap atomic so readers never observe a
+    truncated file if the process dies mid-write.
+    """
+    data = dumps_json_bytes(obj, indent=indent)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+# In-memory cache of the pr/ and issues/ index files. _update_index used to
+# read, decode, mutate and rewrite the whole index file on every save, which
+# is O(N^2) bytes over a batch. Each process now reads an index once, serves
+# mutations from memory and flushes the consolidated file at exit (or
+# explicitly via flush_github_indices between batches). Each update is also
+# appended as a one-line record to an index.log.jsonl sidecar - an O(delta)
+# durable write - which is replayed on the next load and removed when the
+# consolidated index is flushed, so a crash between flushes loses nothing.
+_INDEX_CACHE: dict[Path, dict] = {}
+_INDEX_DIRTY: set[Path] = set()
+
+
+def _index_log_file(index_file: Path) -> Path:
+    return index_file.with_name(index_file.stem + ".log.jsonl")
+
+
+# Optional binary index format. With AUTO_CLAUDE_INDEX_FMT=msgpack (and
+# msgspec installed) the consolidated index is flushed as index.msgpack
+# instead of JSON - no whitespace, no number-to-string conversion, and a
+# decode that is several times faster once the index reaches thousands of
+# entries. JSON stays the default; reads prefer the sidecar when present.
+# Both flush paths keep index.json current - the sidecar only accelerates
+# reads - and the JSON flush removes a stale sidecar, so the two never
+# drift whichever mode a reader runs in.
+def _index_msgpack_file(index_file: Path) -> Path:
+    return index_file.with_suffix(".msgpack")
+
+
+def _use_msgpack_index() -> bool:
+    return (
+        msgspec is not None
+        and os.environ.get("AUTO_CLAUDE_INDEX_FMT") == "msgpack"
+    )
+
+
+def _load_index_file(index_file: Path) -> dict | None:
+    """Load an index from disk, preferring the binary sidecar if present."""
+    msgpack_file = _index_msgpack_file(index_file)
+    if msgspec is not None and msgpack_file.exists():
+        return msgspec.msgpack.decode(msgpack_file.read_bytes(), type=dict)
+    if index_file.exists():
+        return _load_json(index_file)
+    return None
+
+
+def _append_index_log(index_file: Path, record: dict) -> None:
+    """Append one update record to the sidecar log (single small write).
+
+    Taken under the index lock: a record appended while a sibling process
+    is flushing would otherwise be read-missed and then unlinked with the
+    rest of the log, losing the entry for good.
+    """
+    with FileLock(index_file, timeout=5.0):
+        with open(_index_log_file(index_file), "ab") as f:
+            f.write(dumps_json_bytes(record, indent=0) + b"\n")
+
+
+def _replay_index_log(index_file: Path, data: dict | None) -> dict | None:
+    """Re-apply logged updates that a previous process never compacted.
+
+    Records are upserted in order (last write wins per key), so replaying
+    a log that was already compacted is idempotent. A torn final line from
+    a crash mid-append is skipped.
+    """
+    log_file = _index_log_file(index_file)
+    if not log_file.exists():
+        return data
+
+    for line in log_file.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = loads_json_bytes(line)
+        except ValueError:
+            continue
+        if data is None:
+            data = {}
+        entries = data.setdefault(record["list"], [])
+        key = record["key"]
+        entry = record["entry"]
+        idx = next(
+            (i for i, e in enumerate(entries) if e.get(key) == entry[key]), -1
+        )
+        if idx >= 0:
+            entries[idx] = entry
+        else:
+            entries.append(entry)
+        data["last_updated"] = record["last_updated"]
+    return data
+
+
+async def _update_cached_index(
+    index_file: Path, updater, log_record: dict | None = None
+) -> None:
+    """Apply updater to the in-memory index, loading it from disk once."""
+    data = _INDEX_CACHE.get(index_file)
+    if data is None:
+        # First load in this process: read the consolidated file and
+        # replay the shared log under the lock, so a sibling's flush
+        # cannot unlink the log between the existence check and the read
+        async with FileLock(index_file, timeout=5.0):
+            data = _load_index_file(index_file)
+            data = _replay_index_log(index_file, data)
+        if data is not None:
+            _INDEX_CACHE[index_file] = data
+
+    # No-op save: the indexed entry is already identical (common when a
+    # state is saved repeatedly within one status phase, e.g. autofix
+    # polling loops). Skip the update, the log append and the dirty mark;
+    # last_updated deliberately keeps its earlier value so an unchanged
+    # index is not rewritten at flush time.
+    if log_record is not None and data is not None:
+        key = log_record["key"]
+        entry = log_record["entry"]
+        existing = next(
+            (
+                e
+                for e in data.get(log_record["list"], [])
+                if e.get(key) == entry[key]
+            ),
+            None,
+        )
+        if existing == entry:
+            return
+
+    _INDEX_CACHE[index_file] = updater(data)
+    _INDEX_DIRTY.add(index_file)
+    if log_record is not None:
+        # Lock acquisition can block, so keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            None, _append_index_log, index_file, log_record
+        )
 
 
+def _flush_index(index_file: Path) -> None:
+    """Consolidate one index back to disk (locked, atomic) and drop the log.
+
+    The log is shared between processes, so the flush does not trust this
+    process's cached snapshot: under the lock it re-reads the on-disk
+    index and replays the full log - which contains every process's
+    updates in append order, including this one's - before writing. A
+    concurrent runner's entries (or a crashed sibling's only durability
+    record) are therefore merged rather than clobbered, and the log is
+    only removed once its contents are in the consolidated file.
+    """
+    if _INDEX_CACHE.get(index_file) is not None:
+        with FileLock(index_file, timeout=5.0):
+            data = _load_index_file(index_file)
+            data = _replay_index_log(index_file, data)
+            if data is not None:
+                msgpack_file = _index_msgpack_file(index_file)
+                if _use_msgpack_index():
+                    payload = msgspec.msgpack.encode(data)
+                    tmp = msgpack_file.with_name(msgpack_file.name + ".tmp")
+                    tmp.write_bytes(payload)
+                    os.replace(tmp, msgpack_file)
+                    # Keep index.json current too: cleanup pruning and
+                    # msgspec-less environments read it directly, so the
+                    # sidecar is a read accelerator, never the only copy
+                    _dump_json(index_file, data, indent=0)
+                else:
+                    # Index files are only read by the tool itself - write
+                    # them compact; indentation roughly doubles encode
+                    # time and size
+                    _dump_json(index_file, data, indent=0)
+                    msgpack_file.unlink(missing_ok=True)
+                _index_log_file(index_file).unlink(missing_ok=True)
+                _INDEX_CACHE[index_file] = data
+    _INDEX_DIRTY.discard(index_file)
+
+
+def flush_github_indices() -> None:
+    """Flush any dirty in-memory index caches to disk.
+
+    Registered as an atexit hook; batch callers can also invoke it between
+    batches to bound data loss on hard crashes. Index files are derived
+    metadata - the per-PR/per-issue files themselves are still written
+    through on every save.
+    """
+    for index_file in list(_INDEX_DIRTY):
+        _flush_index(index_file)
+
+
+atexit.register(flush_github_indices)
+
+
+# Directories already created by _ensure_dir - saves two syscalls
+# (stat + mkdir) per save after the first one in a batch.
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir -p, memoized per process."""
+    if path in _ENSURED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+def _set_fields(obj, attrs: dict) -> None:
+    """Assign instance attributes on a bare instance (slots-compatible)."""
+    for name, value in attrs.items():
+        setattr(obj, name, value)
+
+
+# Cached seconds prefix for _now_iso() - timestamps are generated on every
+# instantiation and save, so avoid rebuilding the full datetime string when
+# multiple calls land within the same second (common during batch ingestion).
+_LAST_SEC: int = -1
+_LAST_PREFIX: str = ""
+
+
+def _now_iso() -> str:
+    """Fast equivalent of ``datetime.now().isoformat()``.
+
+    Formats via time.strftime and caches the seconds-level prefix so
+    sub-second repeat calls only pay for the microsecond suffix.
+    """
+    global _LAST_SEC, _LAST_PREFIX
+    now = time.time()
+    secs = int(now)
+    if secs != _LAST_SEC:
+        _LAST_PREFIX = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(secs))
+        _LAST_SEC = secs
+    return f"{_LAST_PREFIX}.{int((now - secs) * 1_000_000):06d}"
+
+
+# The enums below intentionally stay str-valued rather than IntEnum.
+# Members already short-circuit equality on identity, the deserialization
+# hot path resolves them through the _BY_VALUE dict tables, and dozens of
+# call sites (runner output, review summaries, index entries) consume
+# .value directly as the wire/display string. An int runtime
+# representation would force a str mapping at every one of those sites
+# for no measurable gain.
 class ReviewSeverity(str, Enum):
     """Severity levels for PR review findings."""
 
@@ -200,7 +495,29 @@ class AutoFixStatus(str, Enum):
         return new_state in valid_transitions.get(self, set())
 
 
-@dataclass
+# Value -> member lookup tables for the enums touched on deserialization.
+# A dict hit avoids EnumMeta.__call__ (argument validation plus a
+# _missing_ scan) on every from_dict call.
+_SEVERITY_BY_VALUE = {e.value: e for e in ReviewSeverity}
+_CATEGORY_BY_VALUE = {e.value: e for e in ReviewCategory}
+_MERGE_VERDICT_BY_VALUE = {e.value: e for e in MergeVerdict}
+_AI_COMMENT_VERDICT_BY_VALUE = {e.value: e for e in AICommentVerdict}
+_TRIAGE_BY_VALUE = {e.value: e for e in TriageCategory}
+_AUTOFIX_STATUS_BY_VALUE = {e.value: e for e in AutoFixStatus}
+
+
+def _coerce_enum(table: dict, enum_cls, value):
+    """Dict-first enum coercion for the from_dict hot paths.
+
+    Falls back to the enum constructor on a miss so an unrecognized value
+    still raises ValueError - callers (e.g. autofix queue listing) catch
+    that to skip corrupt state files.
+    """
+    member = table.get(value)
+    return member if member is not None else enum_cls(value)
+
+
+@dataclass(slots=True)
 class PRReviewFinding:
     """A single finding from a PR review."""
 
@@ -230,51 +547,47 @@ class PRReviewFinding:
     validation_explanation: str | None = None  # Why finding was validated/dismissed
 
     def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "severity": self.severity.value,
-            "category": self.category.value,
-            "title": self.title,
-            "description": self.description,
-            "file": self.file,
-            "line": self.line,
-            "end_line": self.end_line,
-            "suggested_fix": self.suggested_fix,
-            "fixable": self.fixable,
-            # NEW fields
-            "confidence": self.confidence,
-            "verification_note": self.verification_note,
-            "redundant_with": self.redundant_with,
-            # Validation fields
-            "validation_status": self.validation_status,
-            "validation_evidence": self.validation_evidence,
-            "validation_confidence": self.validation_confidence,
-            "validation_explanation": self.validation_explanation,
-        }
+        # attrgetter loads all fields in one C call instead of one LOAD_ATTR
+        # per field - this is the hot loop when encoding large reviews.
+        # severity/category stay as enum members: they subclass str, so they
+        # compare and serialize identically to their .value.
+        return dict(zip(_FINDING_KEYS, _FINDING_GET(self)))
 
     @classmethod
     def from_dict(cls, data: dict) -> PRReviewFinding:
-        return cls(
-            id=data["id"],
-            severity=ReviewSeverity(data["severity"]),
-            category=ReviewCategory(data["category"]),
-            title=data["title"],
-            description=data["description"],
-            file=data["file"],
-            line=data["line"],
-            end_line=data.get("end_line"),
-            suggested_fix=data.get("suggested_fix"),
-            fixable=data.get("fixable", False),
+        # Bypass __init__ to skip keyword binding and default-factory
+        # evaluation - this runs once per finding when loading large reviews.
+        obj = object.__new__(cls)
+        get = data.get
+        attrs = {
+            "id": data["id"],
+            "severity": _coerce_enum(_SEVERITY_BY_VALUE, ReviewSeverity, data["severity"]),
+            "category": _coerce_enum(_CATEGORY_BY_VALUE, ReviewCategory, data["category"]),
+            "title": data["title"],
+            "description": data["description"],
+            "file": data["file"],
+            "line": data["line"],
+            "end_line": get("end_line"),
+            "suggested_fix": get("suggested_fix"),
+            "fixable": get("fixable", False),
             # NEW fields
-            confidence=data.get("confidence", 0.85),
-            verification_note=data.get("verification_note"),
-            redundant_with=data.get("redundant_with"),
+            "confidence": get("confidence", 0.85),
+            "verification_note": get("verification_note"),
+            "redundant_with": get("redundant_with"),
             # Validation fields
-            validation_status=data.get("validation_status"),
-            validation_evidence=data.get("validation_evidence"),
-            validation_confidence=data.get("validation_confidence"),
-            validation_explanation=data.get("validation_explanation"),
-        )
+            "validation_status": get("validation_status"),
+            "validation_evidence": get("validation_evidence"),
+            "validation_confidence": get("validation_confidence"),
+            "validation_explanation": get("validation_explanation"),
+        }
+        _set_fields(obj, attrs)
+        return obj
+
+
+# Field order matches the PRReviewFinding declaration (and the previous
+# hand-written to_dict), so serialized key order is unchanged.
+_FINDING_KEYS = tuple(f.name for f in fields(PRReviewFinding))
+_FINDING_GET = attrgetter(*_FINDING_KEYS)
 
 
 @dataclass
@@ -293,7 +606,7 @@ class AICommentTriage:
             "comment_id": self.comment_id,
             "tool_name": self.tool_name,
             "original_comment": self.original_comment,
-            "verdict": self.verdict.value,
+            "verdict": self.verdict,
             "reasoning": self.reasoning,
             "response_comment": self.response_comment,
         }
@@ -304,7 +617,7 @@ class AICommentTriage:
             comment_id=data["comment_id"],
             tool_name=data["tool_name"],
             original_comment=data["original_comment"],
-            verdict=AICommentVerdict(data["verdict"]),
+            verdict=_coerce_enum(_AI_COMMENT_VERDICT_BY_VALUE, AICommentVerdict, data["verdict"]),
             reasoning=data["reasoning"],
             response_comment=data.get("response_comment"),
         )
@@ -326,7 +639,7 @@ class StructuralIssue:
         return {
             "id": self.id,
             "issue_type": self.issue_type,
-            "severity": self.severity.value,
+            "severity": self.severity,
             "title": self.title,
             "description": self.description,
             "impact": self.impact,
@@ -338,7 +651,7 @@ class StructuralIssue:
         return cls(
             id=data["id"],
             issue_type=data["issue_type"],
-            severity=ReviewSeverity(data["severity"]),
+            severity=_coerce_enum(_SEVERITY_BY_VALUE, ReviewSeverity, data["severity"]),
             title=data["title"],
             description=data["description"],
             impact=data["impact"],
@@ -346,7 +659,13 @@ class StructuralIssue:
         )
 
 
-@dataclass
+# List fields below deliberately keep default_factory=list rather than a
+# shared empty-list sentinel: callers mutate them in place after creation
+# (e.g. orchestrator appends CI blockers to result.blockers), so a shared
+# default would leak appends across every instance unless every mutation
+# site carried a copy-on-write guard. The per-instance list is ~56 bytes;
+# not worth that tripwire.
+@dataclass(slots=True)
 class PRReviewResult:
     """Complete result of a PR review."""
 
@@ -357,7 +676,7 @@ class PRReviewResult:
     summary: str = ""
     overall_status: str = "comment"  # approve, request_changes, comment
     review_id: int | None = None
-    reviewed_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    reviewed_at: str = field(default_factory=_now_iso)
     error: str | None = None
 
     # NEW: Enhanced verdict system
@@ -412,7 +731,7 @@ class PRReviewResult:
             "reviewed_at": self.reviewed_at,
             "error": self.error,
             # NEW fields
-            "verdict": self.verdict.value,
+            "verdict": self.verdict,
             "verdict_reasoning": self.verdict_reasoning,
             "blockers": self.blockers,
             "risk_assessment": self.risk_assessment,
@@ -434,21 +753,25 @@ class PRReviewResult:
 
     @classmethod
     def from_dict(cls, data: dict) -> PRReviewResult:
-        return cls(
-            pr_number=data["pr_number"],
-            repo=data["repo"],
-            success=data["success"],
-            findings=[PRReviewFinding.from_dict(f) for f in data.get("findings", [])],
-            summary=data.get("summary", ""),
-            overall_status=data.get("overall_status", "comment"),
-            review_id=data.get("review_id"),
-            reviewed_at=data.get("reviewed_at", datetime.now().isoformat()),
-            error=data.get("error"),
+        # Bypass __init__ so loading archived reviews doesn't re-run
+        # keyword binding and default factories (including _now_iso).
+        obj = object.__new__(cls)
+        get = data.get
+        attrs = {
+            "pr_number": data["pr_number"],
+            "repo": data["repo"],
+            "success": data["success"],
+            "findings": [PRReviewFinding.from_dict(f) for f in get("findings", [])],
+            "summary": get("summary", ""),
+            "overall_status": get("overall_status", "comment"),
+            "review_id": get("review_id"),
+            "reviewed_at": get("reviewed_at") or _now_iso(),
+            "error": get("error"),
             # NEW fields
-            verdict=MergeVerdict(data.get("verdict", "ready_to_merge")),
-            verdict_reasoning=data.get("verdict_reasoning", ""),
-            blockers=data.get("blockers", []),
-            risk_assessment=data.get(
+            "verdict": _coerce_enum(_MERGE_VERDICT_BY_VALUE, MergeVerdict, get("verdict", "ready_to_merge")),
+            "verdict_reasoning": get("verdict_reasoning", ""),
+            "blockers": get("blockers", []),
+            "risk_assessment": get(
                 "risk_assessment",
                 {
                     "complexity": "low",
@@ -456,78 +779,98 @@ class PRReviewResult:
                     "scope_coherence": "good",
                 },
             ),
-            structural_issues=[
-                StructuralIssue.from_dict(s) for s in data.get("structural_issues", [])
+            "structural_issues": [
+                StructuralIssue.from_dict(s) for s in get("structural_issues", [])
             ],
-            ai_comment_triages=[
-                AICommentTriage.from_dict(t) for t in data.get("ai_comment_triages", [])
+            "ai_comment_triages": [
+                AICommentTriage.from_dict(t) for t in get("ai_comment_triages", [])
             ],
-            quick_scan_summary=data.get("quick_scan_summary", {}),
+            "quick_scan_summary": get("quick_scan_summary", {}),
             # Follow-up review fields
-            reviewed_commit_sha=data.get("reviewed_commit_sha"),
-            is_followup_review=data.get("is_followup_review", False),
-            previous_review_id=data.get("previous_review_id"),
-            resolved_findings=data.get("resolved_findings", []),
-            unresolved_findings=data.get("unresolved_findings", []),
-            new_findings_since_last_review=data.get(
-                "new_findings_since_last_review", []
-            ),
+            "reviewed_commit_sha": get("reviewed_commit_sha"),
+            "is_followup_review": get("is_followup_review", False),
+            "previous_review_id": get("previous_review_id"),
+            "resolved_findings": get("resolved_findings", []),
+            "unresolved_findings": get("unresolved_findings", []),
+            "new_findings_since_last_review": get("new_findings_since_last_review", []),
             # Posted findings tracking
-            has_posted_findings=data.get("has_posted_findings", False),
-            posted_finding_ids=data.get("posted_finding_ids", []),
-            posted_at=data.get("posted_at"),
-        )
+            "has_posted_findings": get("has_posted_findings", False),
+            "posted_finding_ids": get("posted_finding_ids", []),
+            "posted_at": get("posted_at"),
+        }
+        _set_fields(obj, attrs)
+        return obj
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes in a single field walk."""
+        return _to_json_bytes(self)
 
     async def save(self, github_dir: Path) -> None:
         """Save review result to .auto-claude/github/pr/ with file locking."""
         pr_dir = github_dir / "pr"
-        pr_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(pr_dir)
 
         review_file = pr_dir / f"review_{self.pr_number}.json"
 
         # Atomic locked write
-        await locked_json_write(review_file, self.to_dict(), timeout=5.0)
+        buf = self.to_json_bytes()
+        async with locked_write(review_file, timeout=5.0, mode="wb") as f:
+            f.write(buf)
 
         # Update index with locking
-        await self._update_index(pr_dir)
+        await self._update_index(pr_dir, _now_iso())
 
-    async def _update_index(self, pr_dir: Path) -> None:
-        """Update the PR review index with file locking."""
+    async def _update_index(self, pr_dir: Path, now_iso: str) -> None:
+        """Update the PR review index with file locking.
+
+        now_iso is computed once per save() and shared so the index
+        timestamp is consistent with the rest of the save.
+        """
         index_file = pr_dir / "index.json"
 
+        entry = {
+            "pr_number": self.pr_number,
+            "repo": self.repo,
+            "overall_status": self.overall_status,
+            "findings_count": len(self.findings),
+            "reviewed_at": self.reviewed_at,
+        }
+
         def update_index(current_data):
             """Update function for atomic index update."""
             if current_data is None:
                 current_data = {"reviews": [], "last_updated": None}
 
-            # Update or add entry
+            # Update or add entry (in place - no need to rebuild the list
+            # for a single-slot change)
             reviews = current_data.get("reviews", [])
-            existing = next(
-                (r for r in reviews if r["pr_number"] == self.pr_number), None
+            idx = next(
+                (i for i, r in enumerate(reviews) if r["pr_number"] == self.pr_number),
+                -1,
             )
 
-            entry = {
-                "pr_number": self.pr_number,
-                "repo": self.repo,
-                "overall_status": self.overall_status,
-                "findings_count": len(self.findings),
-                "reviewed_at": self.reviewed_at,
-            }
-
-            if existing:
-                reviews = [
-                    entry if r["pr_number"] == self.pr_number else r for r in reviews
-                ]
+            if idx >= 0:
+                reviews[idx] = entry
             else:
                 reviews.append(entry)
 
             current_data["reviews"] = reviews
-            current_data["last_updated"] = datetime.now().isoformat()
+            current_data["last_updated"] = now_iso
 
             return current_data
 
-        # Atomic locked update
-        await locked_json_update(index_file, update_index, timeout=5.0)
+        # In-memory update plus an O(delta) append to the sidecar log; the
+        # consolidated index is flushed via flush_github_indices
+        await _update_cached_index(
+            index_file,
+            update_index,
+            log_record={
+                "list": "reviews",
+                "key": "pr_number",
+                "entry": entry,
+                "last_updated": now_iso,
+            },
+        )
 
     @classmethod
     def load(cls, github_dir: Path, pr_number: int) -> PRReviewResult | None:
@@ -536,8 +879,9 @@ class PRReviewResult:
         if not review_file.exists():
             return None
 
-        with open(review_file) as f:
-            return cls.from_dict(json.load(f))
+        if _PR_REVIEW_DECODER is not None:
+            return _review_result_from_raw(_PR_REVIEW_DECODER.decode(review_file.read_bytes()))
+        return cls.from_dict(_load_json(review_file))
 
 
 @dataclass
@@ -566,7 +910,7 @@ class FollowupReviewContext:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TriageResult:
     """Result of triaging a single issue."""
 
@@ -583,13 +927,13 @@ class TriageResult:
     suggested_breakdown: list[str] = field(default_factory=list)
     priority: str = "medium"  # high, medium, low
     comment: str | None = None
-    triaged_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    triaged_at: str = field(default_factory=_now_iso)
 
     def to_dict(self) -> dict:
         return {
             "issue_number": self.issue_number,
             "repo": self.repo,
-            "category": self.category.value,
+            "category": self.category,
             "confidence": self.confidence,
             "labels_to_add": self.labels_to_add,
             "labels_to_remove": self.labels_to_remove,
@@ -605,32 +949,43 @@ class TriageResult:
 
     @classmethod
     def from_dict(cls, data: dict) -> TriageResult:
-        return cls(
-            issue_number=data["issue_number"],
-            repo=data["repo"],
-            category=TriageCategory(data["category"]),
-            confidence=data["confidence"],
-            labels_to_add=data.get("labels_to_add", []),
-            labels_to_remove=data.get("labels_to_remove", []),
-            is_duplicate=data.get("is_duplicate", False),
-            duplicate_of=data.get("duplicate_of"),
-            is_spam=data.get("is_spam", False),
-            is_feature_creep=data.get("is_feature_creep", False),
-            suggested_breakdown=data.get("suggested_breakdown", []),
-            priority=data.get("priority", "medium"),
-            comment=data.get("comment"),
-            triaged_at=data.get("triaged_at", datetime.now().isoformat()),
-        )
+        # Bypass __init__ - see PRReviewFinding.from_dict.
+        obj = object.__new__(cls)
+        get = data.get
+        attrs = {
+            "issue_number": data["issue_number"],
+            "repo": data["repo"],
+            "category": _coerce_enum(_TRIAGE_BY_VALUE, TriageCategory, data["category"]),
+            "confidence": data["confidence"],
+            "labels_to_add": get("labels_to_add", []),
+            "labels_to_remove": get("labels_to_remove", []),
+            "is_duplicate": get("is_duplicate", False),
+            "duplicate_of": get("duplicate_of"),
+            "is_spam": get("is_spam", False),
+            "is_feature_creep": get("is_feature_creep", False),
+            "suggested_breakdown": get("suggested_breakdown", []),
+            "priority": get("priority", "medium"),
+            "comment": get("comment"),
+            "triaged_at": get("triaged_at") or _now_iso(),
+        }
+        _set_fields(obj, attrs)
+        return obj
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes in a single field walk."""
+        return _to_json_bytes(self)
 
     async def save(self, github_dir: Path) -> None:
         """Save triage result to .auto-claude/github/issues/ with file locking."""
         issues_dir = github_dir / "issues"
-        issues_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(issues_dir)
 
         triage_file = issues_dir / f"triage_{self.issue_number}.json"
 
         # Atomic locked write
-        await locked_json_write(triage_file, self.to_dict(), timeout=5.0)
+        buf = self.to_json_bytes()
+        async with locked_write(triage_file, timeout=5.0, mode="wb") as f:
+            f.write(buf)
 
     @classmethod
     def load(cls, github_dir: Path, issue_number: int) -> TriageResult | None:
@@ -639,11 +994,12 @@ class TriageResult:
         if not triage_file.exists():
             return None
 
-        with open(triage_file) as f:
-            return cls.from_dict(json.load(f))
+        if _TRIAGE_DECODER is not None:
+            return _triage_result_from_raw(_TRIAGE_DECODER.decode(triage_file.read_bytes()))
+        return cls.from_dict(_load_json(triage_file))
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoFixState:
     """State tracking for auto-fix operations."""
 
@@ -657,15 +1013,15 @@ class AutoFixState:
     pr_url: str | None = None
     bot_comments: list[str] = field(default_factory=list)
     error: str | None = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
 
     def to_dict(self) -> dict:
         return {
             "issue_number": self.issue_number,
             "issue_url": self.issue_url,
             "repo": self.repo,
-            "status": self.status.value,
+            "status": self.status,
             "spec_id": self.spec_id,
             "spec_dir": self.spec_dir,
             "pr_number": self.pr_number,
@@ -685,20 +1041,25 @@ class AutoFixState:
             data.get("issue_url") or f"https://github.com/{repo}/issues/{issue_number}"
         )
 
-        return cls(
-            issue_number=issue_number,
-            issue_url=issue_url,
-            repo=repo,
-            status=AutoFixStatus(data.get("status", "pending")),
-            spec_id=data.get("spec_id"),
-            spec_dir=data.get("spec_dir"),
-            pr_number=data.get("pr_number"),
-            pr_url=data.get("pr_url"),
-            bot_comments=data.get("bot_comments", []),
-            error=data.get("error"),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            updated_at=data.get("updated_at", datetime.now().isoformat()),
-        )
+        # Bypass __init__ - see PRReviewFinding.from_dict.
+        obj = object.__new__(cls)
+        get = data.get
+        attrs = {
+            "issue_number": issue_number,
+            "issue_url": issue_url,
+            "repo": repo,
+            "status": _coerce_enum(_AUTOFIX_STATUS_BY_VALUE, AutoFixStatus, get("status", "pending")),
+            "spec_id": get("spec_id"),
+            "spec_dir": get("spec_dir"),
+            "pr_number": get("pr_number"),
+            "pr_url": get("pr_url"),
+            "bot_comments": get("bot_comments", []),
+            "error": get("error"),
+            "created_at": get("created_at") or _now_iso(),
+            "updated_at": get("updated_at") or _now_iso(),
+        }
+        _set_fields(obj, attrs)
+        return obj
 
     def update_status(self, status: AutoFixStatus) -> None:
         """Update status and timestamp with transition validation."""
@@ -707,25 +1068,44 @@ class AutoFixState:
                 f"Invalid state transition: {self.status.value} -> {status.value}"
             )
         self.status = status
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes in a single field walk."""
+        return _to_json_bytes(self)
 
     async def save(self, github_dir: Path) -> None:
         """Save auto-fix state to .auto-claude/github/issues/ with file locking."""
         issues_dir = github_dir / "issues"
-        issues_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(issues_dir)
 
         autofix_file = issues_dir / f"autofix_{self.issue_number}.json"
 
         # Atomic locked write
-        await locked_json_write(autofix_file, self.to_dict(), timeout=5.0)
+        buf = self.to_json_bytes()
+        async with locked_write(autofix_file, timeout=5.0, mode="wb") as f:
+            f.write(buf)
 
         # Update index with locking
-        await self._update_index(issues_dir)
+        await self._update_index(issues_dir, _now_iso())
 
-    async def _update_index(self, issues_dir: Path) -> None:
-        """Update the issues index with auto-fix queue using file locking."""
+    async def _update_index(self, issues_dir: Path, now_iso: str) -> None:
+        """Update the issues index with auto-fix queue using file locking.
+
+        now_iso is computed once per save() and shared so the index
+        timestamp is consistent with the rest of the save.
+        """
         index_file = issues_dir / "index.json"
 
+        entry = {
+            "issue_number": self.issue_number,
+            "repo": self.repo,
+            "status": self.status.value,
+            "spec_id": self.spec_id,
+            "pr_number": self.pr_number,
+            "updated_at": self.updated_at,
+        }
+
         def update_index(current_data):
             """Update function for atomic index update."""
             if current_data is None:
@@ -734,37 +1114,42 @@ class AutoFixState:
                     "auto_fix_queue": [],
                     "last_updated": None,
                 }
+            current_data.setdefault("triaged", [])
 
-            # Update auto-fix queue
+            # Update auto-fix queue (in place - no need to rebuild the list
+            # for a single-slot change)
             queue = current_data.get("auto_fix_queue", [])
-            existing = next(
-                (q for q in queue if q["issue_number"] == self.issue_number), None
+            idx = next(
+                (
+                    i
+                    for i, q in enumerate(queue)
+                    if q["issue_number"] == self.issue_number
+                ),
+                -1,
             )
 
-            entry = {
-                "issue_number": self.issue_number,
-                "repo": self.repo,
-                "status": self.status.value,
-                "spec_id": self.spec_id,
-                "pr_number": self.pr_number,
-                "updated_at": self.updated_at,
-            }
-
-            if existing:
-                queue = [
-                    entry if q["issue_number"] == self.issue_number else q
-                    for q in queue
-                ]
+            if idx >= 0:
+                queue[idx] = entry
             else:
                 queue.append(entry)
 
             current_data["auto_fix_queue"] = queue
-            current_data["last_updated"] = datetime.now().isoformat()
+            current_data["last_updated"] = now_iso
 
             return current_data
 
-        # Atomic locked update
-        await locked_json_update(index_file, update_index, timeout=5.0)
+        # In-memory update plus an O(delta) append to the sidecar log; the
+        # consolidated index is flushed via flush_github_indices
+        await _update_cached_index(
+            index_file,
+            update_index,
+            log_record={
+                "list": "auto_fix_queue",
+                "key": "issue_number",
+                "entry": entry,
+                "last_updated": now_iso,
+            },
+        )
 
     @classmethod
     def load(cls, github_dir: Path, issue_number: int) -> AutoFixState | None:
@@ -773,11 +1158,12 @@ class AutoFixState:
         if not autofix_file.exists():
             return None
 
-        with open(autofix_file) as f:
-            return cls.from_dict(json.load(f))
+        if _AUTOFIX_DECODER is not None:
+            return _autofix_state_from_raw(_AUTOFIX_DECODER.decode(autofix_file.read_bytes()))
+        return cls.from_dict(_load_json(autofix_file))
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubRunnerConfig:
     """Configuration for GitHub automation runners."""
 
@@ -845,7 +1231,7 @@ class GitHubRunnerConfig:
 
     def save_settings(self, github_dir: Path) -> None:
         """Save non-sensitive settings to config.json."""
-        github_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(github_dir)
         config_file = github_dir / "config.json"
 
         # Save without tokens
@@ -853,8 +1239,7 @@ class GitHubRunnerConfig:
         settings.pop("token", None)
         settings.pop("bot_token", None)
 
-        with open(config_file, "w") as f:
-            json.dump(settings, f, indent=2)
+        _dump_json(config_file, settings)
 
     @classmethod
     def load_settings(
@@ -864,8 +1249,7 @@ class GitHubRunnerConfig:
         config_file = github_dir / "config.json"
 
         if config_file.exists():
-            with open(config_file) as f:
-                settings = json.load(f)
+            settings = _load_json(config_file)
         else:
             settings = {}
 
@@ -894,3 +1278,198 @@ class GitHubRunnerConfig:
             model=settings.get("model", "claude-sonnet-4-20250514"),
             thinking_level=settings.get("thinking_level", "medium"),
         )
+
+
+# ---------------------------------------------------------------------------
+# Typed JSON loaders (optional msgspec fast path)
+# ---------------------------------------------------------------------------
+# msgspec decodes straight into typed structs in C, including the string ->
+# Enum coercion, so load() skips both the generic dict tree and the per-field
+# data.get dance in from_dict. The structs mirror the dataclass fields
+# one-to-one; converting a decoded struct to the dataclass is a plain
+# attribute copy. Without msgspec the from_dict path is used unchanged.
+# msgspec.DecodeError subclasses ValueError, which the existing callers
+# already catch for corrupt state files.
+
+if msgspec is not None:
+
+    class _PRReviewFindingRaw(msgspec.Struct):
+        id: str
+        severity: ReviewSeverity
+        category: ReviewCategory
+        title: str
+        description: str
+        file: str
+        line: int
+        end_line: int | None = None
+        suggested_fix: str | None = None
+        fixable: bool = False
+        confidence: float = 0.85
+        verification_note: str | None = None
+        redundant_with: str | None = None
+        validation_status: str | None = None
+        validation_evidence: str | None = None
+        validation_confidence: float | None = None
+        validation_explanation: str | None = None
+
+    class _StructuralIssueRaw(msgspec.Struct):
+        id: str
+        issue_type: str
+        severity: ReviewSeverity
+        title: str
+        description: str
+        impact: str
+        suggestion: str
+
+    class _AICommentTriageRaw(msgspec.Struct):
+        comment_id: int
+        tool_name: str
+        original_comment: str
+        verdict: AICommentVerdict
+        reasoning: str
+        response_comment: str | None = None
+
+    class _PRReviewResultRaw(msgspec.Struct):
+        pr_number: int
+        repo: str
+        success: bool
+        findings: list[_PRReviewFindingRaw] = msgspec.field(default_factory=list)
+        summary: str = ""
+        overall_status: str = "comment"
+        # Annotated int | None on the dataclass, but existing state files
+        # also carry string review ids - accept both
+        review_id: int | str | None = None
+        reviewed_at: str = ""
+        error: str | None = None
+        verdict: MergeVerdict = MergeVerdict.READY_TO_MERGE
+        verdict_reasoning: str = ""
+        blockers: list[str] = msgspec.field(default_factory=list)
+        risk_assessment: dict = msgspec.field(
+            default_factory=lambda: {
+                "complexity": "low",
+                "security_impact": "none",
+                "scope_coherence": "good",
+            }
+        )
+        structural_issues: list[_StructuralIssueRaw] = msgspec.field(
+            default_factory=list
+        )
+        ai_comment_triages: list[_AICommentTriageRaw] = msgspec.field(
+            default_factory=list
+        )
+        quick_scan_summary: dict = msgspec.field(default_factory=dict)
+        reviewed_commit_sha: str | None = None
+        is_followup_review: bool = False
+        previous_review_id: int | str | None = None
+        resolved_findings: list[str] = msgspec.field(default_factory=list)
+        unresolved_findings: list[str] = msgspec.field(default_factory=list)
+        new_findings_since_last_review: list[str] = msgspec.field(
+            default_factory=list
+        )
+        has_posted_findings: bool = False
+        posted_finding_ids: list[str] = msgspec.field(default_factory=list)
+        posted_at: str | None = None
+
+    class _TriageResultRaw(msgspec.Struct):
+        issue_number: int
+        repo: str
+        category: TriageCategory
+        confidence: float
+        labels_to_add: list[str] = msgspec.field(default_factory=list)
+        labels_to_remove: list[str] = msgspec.field(default_factory=list)
+        is_duplicate: bool = False
+        duplicate_of: int | None = None
+        is_spam: bool = False
+        is_feature_creep: bool = False
+        suggested_breakdown: list[str] = msgspec.field(default_factory=list)
+        priority: str = "medium"
+        comment: str | None = None
+        triaged_at: str = ""
+
+    class _AutoFixStateRaw(msgspec.Struct):
+        issue_number: int
+        repo: str
+        issue_url: str = ""
+        status: AutoFixStatus = AutoFixStatus.PENDING
+        spec_id: str | None = None
+        spec_dir: str | None = None
+        pr_number: int | None = None
+        pr_url: str | None = None
+        bot_comments: list[str] = msgspec.field(default_factory=list)
+        error: str | None = None
+        created_at: str = ""
+        updated_at: str = ""
+
+    _PR_REVIEW_DECODER = msgspec.json.Decoder(_PRReviewResultRaw)
+    _TRIAGE_DECODER = msgspec.json.Decoder(_TriageResultRaw)
+    _AUTOFIX_DECODER = msgspec.json.Decoder(_AutoFixStateRaw)
+else:
+    _PR_REVIEW_DECODER = None
+    _TRIAGE_DECODER = None
+    _AUTOFIX_DECODER = None
+
+_REVIEW_RESULT_KEYS = tuple(f.name for f in fields(PRReviewResult))
+_TRIAGE_KEYS = tuple(f.name for f in fields(TriageResult))
+_AUTOFIX_KEYS = tuple(f.name for f in fields(AutoFixState))
+_STRUCTURAL_KEYS = tuple(f.name for f in fields(StructuralIssue))
+_AI_TRIAGE_KEYS = tuple(f.name for f in fields(AICommentTriage))
+
+# Cached dataclass reflection. dataclasses.asdict() re-runs fields() and
+# deep-copies every value on each call - 2-10x slower than the hand-rolled
+# to_dict methods. Downstream code that wants a plain dict should call
+# to_dict() (wire format, enum-safe) or _fast_asdict (raw attribute values),
+# never dataclasses.asdict.
+PRReviewFinding._TO_DICT_FIELDS = _FINDING_KEYS
+StructuralIssue._TO_DICT_FIELDS = _STRUCTURAL_KEYS
+AICommentTriage._TO_DICT_FIELDS = _AI_TRIAGE_KEYS
+PRReviewResult._TO_DICT_FIELDS = _REVIEW_RESULT_KEYS
+TriageResult._TO_DICT_FIELDS = _TRIAGE_KEYS
+AutoFixState._TO_DICT_FIELDS = _AUTOFIX_KEYS
+GitHubRunnerConfig._TO_DICT_FIELDS = tuple(f.name for f in fields(GitHubRunnerConfig))
+
+
+def _fast_asdict(obj) -> dict:
+    """Shallow asdict over the cached field tuple (no reflection, no copy)."""
+    return {name: getattr(obj, name) for name in obj._TO_DICT_FIELDS}
+
+
+def _copy_raw(cls, raw, keys):
+    """Copy mirrored struct attributes onto a bare dataclass instance."""
+    obj = object.__new__(cls)
+    for name in keys:
+        setattr(obj, name, getattr(raw, name))
+    return obj
+
+
+def _review_result_from_raw(raw) -> PRReviewResult:
+    obj = _copy_raw(PRReviewResult, raw, _REVIEW_RESULT_KEYS)
+    obj.findings = [_copy_raw(PRReviewFinding, f, _FINDING_KEYS) for f in raw.findings]
+    obj.structural_issues = [
+        StructuralIssue(**{k: getattr(i, k) for k in _STRUCTURAL_KEYS})
+        for i in raw.structural_issues
+    ]
+    obj.ai_comment_triages = [
+        AICommentTriage(**{k: getattr(t, k) for k in _AI_TRIAGE_KEYS})
+        for t in raw.ai_comment_triages
+    ]
+    obj.reviewed_at = raw.reviewed_at or _now_iso()
+    return obj
+
+
+def _triage_result_from_raw(raw) -> TriageResult:
+    obj = _copy_raw(TriageResult, raw, _TRIAGE_KEYS)
+    obj.triaged_at = raw.triaged_at or _now_iso()
+    return obj
+
+
+def _autofix_state_from_raw(raw) -> AutoFixState:
+    obj = _copy_raw(AutoFixState, raw, _AUTOFIX_KEYS)
+    # Construct issue_url if missing (backwards compatibility with old
+    # state files, mirroring AutoFixState.from_dict)
+    obj.issue_url = (
+        raw.issue_url
+        or f"https://github.com/{raw.repo}/issues/{raw.issue_number}"
+    )
+    obj.created_at = raw.created_at or _now_iso()
+    obj.updated_at = raw.updated_at or _now_iso()
+    return obj
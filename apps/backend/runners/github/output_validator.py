@@ -433,10 +433,8 @@ class FindingValidator:
             Enhanced finding
         """
         # Add actionability score as confidence if not already present
-        if not hasattr(finding, "confidence") or not finding.confidence:
-            actionability = self._score_actionability(finding)
-            # Add as custom attribute (not in dataclass, but accessible)
-            finding.__dict__["confidence"] = actionability
+        if not finding.confidence:
+            finding.confidence = self._score_actionability(finding)
 
         # Ensure fixable is set correctly based on having a suggested fix
         if (
@@ -0,0 +1,353 @@
+"""
+Tests for GitHub Models Persistence Layer
+=========================================
+
+Tests the index cache, sidecar log replay, flush compaction and the
+fast serialization paths in runners/github/models.py.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+import models
+from models import (
+    AutoFixState,
+    AutoFixStatus,
+    PRReviewFinding,
+    PRReviewResult,
+    ReviewCategory,
+    ReviewSeverity,
+)
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def clean_index_state():
+    """Reset the module-level index cache between tests."""
+    models._INDEX_CACHE.clear()
+    models._INDEX_DIRTY.clear()
+    models._ENSURED_DIRS.clear()
+    yield
+    models._INDEX_CACHE.clear()
+    models._INDEX_DIRTY.clear()
+    models._ENSURED_DIRS.clear()
+
+
+@pytest.fixture
+def temp_github_dir(tmp_path):
+    """Create temporary GitHub directory structure."""
+    github_dir = tmp_path / ".auto-claude" / "github"
+    github_dir.mkdir(parents=True)
+    return github_dir
+
+
+@pytest.fixture
+def sample_state():
+    """Create a sample auto-fix state."""
+    return AutoFixState(
+        issue_number=7,
+        repo="test/repo",
+        issue_url="https://github.com/test/repo/issues/7",
+    )
+
+
+@pytest.fixture
+def sample_review():
+    """Create a sample PR review result with one finding."""
+    return PRReviewResult(
+        pr_number=123,
+        repo="test/repo",
+        success=True,
+        findings=[
+            PRReviewFinding(
+                id="finding-001",
+                severity=ReviewSeverity.HIGH,
+                category=ReviewCategory.SECURITY,
+                title="SQL Injection",
+                description="User input not sanitized",
+                file="src/db.py",
+                line=42,
+                fixable=True,
+            )
+        ],
+        summary="Found 1 security issue",
+        overall_status="request_changes",
+    )
+
+
+def _index_entries(index_file):
+    return models._INDEX_CACHE[index_file]["auto_fix_queue"]
+
+
+# ============================================================================
+# Index Cache / Sidecar Log Tests
+# ============================================================================
+
+class TestIndexLog:
+    """Test the index sidecar log and crash recovery."""
+
+    async def test_save_appends_log_record(self, temp_github_dir, sample_state):
+        """Each save appends one durable record to the sidecar log."""
+        await sample_state.save(temp_github_dir)
+
+        index_file = temp_github_dir / "issues" / "index.json"
+        log_file = models._index_log_file(index_file)
+
+        assert log_file.exists()
+        assert len(log_file.read_bytes().splitlines()) == 1
+        # consolidated index not written until flush
+        assert not index_file.exists()
+
+    async def test_log_replayed_after_simulated_crash(
+        self, temp_github_dir, sample_state
+    ):
+        """A crash before flush loses nothing: the log is replayed on load."""
+        await sample_state.save(temp_github_dir)
+
+        # simulate a crash: the process dies with a dirty cache, no flush
+        index_file = temp_github_dir / "issues" / "index.json"
+        models._INDEX_CACHE.clear()
+        models._INDEX_DIRTY.clear()
+
+        other = AutoFixState(
+            issue_number=8,
+            repo="test/repo",
+            issue_url="https://github.com/test/repo/issues/8",
+        )
+        await other.save(temp_github_dir)
+
+        entries = _index_entries(index_file)
+        assert sorted(e["issue_number"] for e in entries) == [7, 8]
+
+    async def test_torn_log_line_skipped(self, temp_github_dir, sample_state):
+        """A torn final line from a crash mid-append is skipped on replay."""
+        await sample_state.save(temp_github_dir)
+
+        index_file = temp_github_dir / "issues" / "index.json"
+        with open(models._index_log_file(index_file), "ab") as f:
+            f.write(b'{"list": "auto_fix_queue", "key": "iss')  # torn
+
+        models._INDEX_CACHE.clear()
+        data = models._replay_index_log(index_file, None)
+        assert len(data["auto_fix_queue"]) == 1
+
+    async def test_flush_compacts_log(self, temp_github_dir, sample_state):
+        """Flushing writes the consolidated index and removes the log."""
+        await sample_state.save(temp_github_dir)
+
+        index_file = temp_github_dir / "issues" / "index.json"
+        models._flush_index(index_file)
+
+        assert index_file.exists()
+        assert not models._index_log_file(index_file).exists()
+        assert index_file not in models._INDEX_DIRTY
+
+        data = models._load_json(index_file)
+        assert data["auto_fix_queue"][0]["issue_number"] == 7
+
+    async def test_flush_merges_sibling_log_records(
+        self, temp_github_dir, sample_state
+    ):
+        """Flush merges entries logged by a concurrent process."""
+        await sample_state.save(temp_github_dir)
+
+        index_file = temp_github_dir / "issues" / "index.json"
+        # simulate a sibling process appending its own update to the log
+        models._append_index_log(
+            index_file,
+            {
+                "list": "auto_fix_queue",
+                "key": "issue_number",
+                "entry": {"issue_number": 99, "status": "building"},
+                "last_updated": "2025-01-01T00:00:00",
+            },
+        )
+
+        models._flush_index(index_file)
+
+        data = models._load_json(index_file)
+        nums = sorted(e["issue_number"] for e in data["auto_fix_queue"])
+        assert nums == [7, 99]
+
+    async def test_noop_save_skips_log_and_dirty(
+        self, temp_github_dir, sample_state
+    ):
+        """Re-saving an unchanged state is a no-op for the index."""
+        await sample_state.save(temp_github_dir)
+
+        index_file = temp_github_dir / "issues" / "index.json"
+        log_file = models._index_log_file(index_file)
+        models._flush_index(index_file)
+        first_updated = models._INDEX_CACHE[index_file]["last_updated"]
+
+        await sample_state.save(temp_github_dir)
+        await sample_state.save(temp_github_dir)
+
+        assert not log_file.exists()
+        assert index_file not in models._INDEX_DIRTY
+        assert models._INDEX_CACHE[index_file]["last_updated"] == first_updated
+
+        # a real change is indexed again
+        sample_state.status = AutoFixStatus.BUILDING
+        sample_state.updated_at = models._now_iso()
+        await sample_state.save(temp_github_dir)
+
+        assert log_file.exists()
+        assert index_file in models._INDEX_DIRTY
+        assert _index_entries(index_file)[0]["status"] == "building"
+
+
+# ============================================================================
+# Msgpack Sidecar Tests
+# ============================================================================
+
+@pytest.mark.skipif(models.msgspec is None, reason="msgspec not installed")
+class TestMsgpackIndex:
+    """Test the opt-in binary index format."""
+
+    async def test_msgpack_roundtrip(
+        self, temp_github_dir, sample_state, monkeypatch
+    ):
+        """Msgpack mode writes the sidecar and keeps index.json current."""
+        monkeypatch.setenv("AUTO_CLAUDE_INDEX_FMT", "msgpack")
+
+        await sample_state.save(temp_github_dir)
+        index_file = temp_github_dir / "issues" / "index.json"
+        models._flush_index(index_file)
+
+        msgpack_file = models._index_msgpack_file(index_file)
+        assert msgpack_file.exists()
+        # index.json stays in sync for direct JSON readers
+        json_data = models._load_json(index_file)
+        binary_data = models.msgspec.msgpack.decode(msgpack_file.read_bytes())
+        assert binary_data == json_data
+        assert json_data["auto_fix_queue"][0]["issue_number"] == 7
+
+        # reload goes through the sidecar
+        models._INDEX_CACHE.clear()
+        assert models._load_index_file(index_file) == json_data
+
+    async def test_json_flush_removes_stale_sidecar(
+        self, temp_github_dir, sample_state, monkeypatch
+    ):
+        """Switching back to JSON mode drops the binary sidecar."""
+        monkeypatch.setenv("AUTO_CLAUDE_INDEX_FMT", "msgpack")
+        await sample_state.save(temp_github_dir)
+        index_file = temp_github_dir / "issues" / "index.json"
+        models._flush_index(index_file)
+        assert models._index_msgpack_file(index_file).exists()
+
+        monkeypatch.delenv("AUTO_CLAUDE_INDEX_FMT")
+        sample_state.status = AutoFixStatus.BUILDING
+        sample_state.updated_at = models._now_iso()
+        await sample_state.save(temp_github_dir)
+        models._flush_index(index_file)
+
+        assert not models._index_msgpack_file(index_file).exists()
+        data = models._load_json(index_file)
+        assert data["auto_fix_queue"][0]["status"] == "building"
+
+
+# ============================================================================
+# Timestamp Tests
+# ============================================================================
+
+class TestNowIso:
+    """Test the fast ISO timestamp helper."""
+
+    def test_format_parity_with_datetime(self):
+        """_now_iso produces datetime.isoformat()-compatible strings."""
+        stamp = models._now_iso()
+        parsed = datetime.fromisoformat(stamp)
+        assert parsed.strftime("%Y-%m-%dT%H:%M:%S") == stamp[:19]
+        # microseconds are always present, zero-padded to 6 digits
+        assert len(stamp.split(".")[1]) == 6
+
+    def test_monotonic_enough_for_ordering(self):
+        """Consecutive timestamps never go backwards."""
+        stamps = [models._now_iso() for _ in range(100)]
+        assert stamps == sorted(stamps)
+
+
+# ============================================================================
+# Serialization Roundtrip Tests
+# ============================================================================
+
+class TestSerializationRoundtrips:
+    """Test save/load roundtrips across the fast and fallback paths."""
+
+    async def test_roundtrip_fast_paths(self, temp_github_dir, sample_review):
+        """Roundtrip through whatever fast paths are installed."""
+        await sample_review.save(temp_github_dir)
+        loaded = PRReviewResult.load(temp_github_dir, 123)
+
+        assert loaded.repo == sample_review.repo
+        assert loaded.findings[0].severity == ReviewSeverity.HIGH
+        assert loaded.findings[0].category == ReviewCategory.SECURITY
+
+    async def test_roundtrip_without_orjson(
+        self, temp_github_dir, sample_review, monkeypatch
+    ):
+        """The to_dict() fallback encoder produces an equivalent file."""
+        monkeypatch.setattr(models, "orjson", None)
+
+        await sample_review.save(temp_github_dir)
+        loaded = PRReviewResult.load(temp_github_dir, 123)
+
+        assert loaded.pr_number == 123
+        assert loaded.findings[0].title == "SQL Injection"
+
+    async def test_roundtrip_without_msgspec_decoder(
+        self, temp_github_dir, sample_review, monkeypatch
+    ):
+        """The from_dict fallback decoder handles the same files."""
+        await sample_review.save(temp_github_dir)
+        monkeypatch.setattr(models, "_PR_REVIEW_DECODER", None)
+
+        loaded = PRReviewResult.load(temp_github_dir, 123)
+
+        assert loaded.pr_number == 123
+        assert loaded.findings[0].severity == ReviewSeverity.HIGH
+        assert loaded.overall_status == "request_changes"
+
+    async def test_autofix_roundtrip_without_msgspec_decoder(
+        self, temp_github_dir, sample_state, monkeypatch
+    ):
+        """AutoFixState from_dict fallback roundtrips."""
+        sample_state.status = AutoFixStatus.BUILDING
+        await sample_state.save(temp_github_dir)
+        monkeypatch.setattr(models, "_AUTOFIX_DECODER", None)
+
+        loaded = AutoFixState.load(temp_github_dir, 7)
+
+        assert loaded.issue_number == 7
+        assert loaded.status == AutoFixStatus.BUILDING
+
+    def test_unknown_enum_value_raises_value_error(self):
+        """Unknown enum values raise ValueError (callers skip on that)."""
+        with pytest.raises(ValueError):
+            AutoFixState.from_dict(
+                {
+                    "issue_number": 1,
+                    "repo": "test/repo",
+                    "issue_url": "u",
+                    "status": "not_a_status",
+                }
+            )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])